@@ -6,6 +6,7 @@ allow easier templating of collections data structures, such as dict-like
 template objects.
 """
 
+import functools
 import logging
 from abc import ABCMeta, abstractmethod
 from collections import abc
@@ -22,6 +23,8 @@ logger = logging.getLogger(__name__)
 
 
 class Formattable(metaclass=ABCMeta):
+    __slots__ = ()
+
     @abstractmethod
     def format(self):  # noqa: A003
         raise NotImplementedError
@@ -34,6 +37,8 @@ class StringTemplate(Formattable):
     environ values and overrides.
     """
 
+    __slots__ = ("_format_string", "_sanitizer")
+
     def __init__(self, format_string, sanitizer=None):
         """This class acts like a wrapper around a format string.
 
@@ -94,6 +99,8 @@ class ChoiceTemplate(Formattable):
     the command line interface.
     """
 
+    __slots__ = ("_values",)
+
     def __init__(self, head, tail):
         """Class to hold multiple string for a single key.
 
@@ -359,6 +366,11 @@ class TemplateList(abc.MutableSequence):
                 self.data.insert(index, new_value)
 
 
+@functools.lru_cache(maxsize=128)
+def _field_names(format_string):
+    return tuple(item[1] for item in Formatter().parse(format_string) if item[1])
+
+
 class FormatterEnviron(abc.Mapping):
     """Class wrapping an environ and providing an interface to render templates.
 
@@ -374,7 +386,7 @@ class FormatterEnviron(abc.Mapping):
         :type environ: :class:`bool`, optional
         """
         self.data = project.environ
-        self._keys = set()
+        self._keys = ()
         self._sanitizer = sanitizer
 
     def __contains__(self, key):
@@ -418,6 +430,6 @@ class FormatterEnviron(abc.Mapping):
         :rtype: :class:`str` or `None`
         """
 
-        self._keys = [item[1] for item in Formatter().parse(format_string) if item[1]]
+        self._keys = _field_names(format_string)
         formatted_string = format_string.format(**self)
         return formatted_string if None not in self.values() else None
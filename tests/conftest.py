@@ -0,0 +1,41 @@
+from collections import abc
+
+from pytest import fixture
+
+from incipyt import project
+from incipyt.__main__ import feed_environ
+from incipyt.project.environment import _Environment
+from incipyt.project.meta_variables import Variable
+
+
+@fixture(autouse=True)
+def fresh_environ(monkeypatch):
+    monkeypatch.setattr(project, "environ", _Environment())
+
+
+@fixture(scope="session")
+def variables_snapshot():
+    return project.variables.copy()
+
+
+@fixture(scope="function")
+def patch_variables(variables_snapshot):
+    try:
+        project.variables.clear()
+
+        def patch(env_vars=None, required=False):
+            env_vars = env_vars or []
+            if isinstance(env_vars, abc.Mapping):
+                for key, value in env_vars.items():
+                    Variable(key, default=value, required=required)
+            else:
+                for key in env_vars:
+                    Variable(key, required=required)
+            if env_vars:
+                feed_environ()
+
+        yield patch
+
+    finally:
+        project.variables.clear()
+        project.variables.update(variables_snapshot)
@@ -1,17 +1,11 @@
-from pytest import fixture, mark, raises
+from pytest import mark, param, raises
 
 from incipyt import project
-from incipyt.__main__ import feed_environ
 from incipyt._internal.dumpers import CfgIni, TextFile, Toml
 
 
-@fixture
-def reset_environ():
-    feed_environ()
-
-
 @mark.parametrize("dumper", (CfgIni, Toml, TextFile))
-def test_format_path(dumper, reset_environ, tmp_path):
+def test_format_path(dumper, tmp_path):
     dmp = dumper("{first}/{second}.ext")
     project.environ["first"] = "folder"
     project.environ["second"] = "file"
@@ -20,7 +14,7 @@ def test_format_path(dumper, reset_environ, tmp_path):
 
 
 @mark.parametrize("dumper", (CfgIni, Toml, TextFile))
-def test_mkdir(dumper, reset_environ, tmp_path):
+def test_mkdir(dumper, tmp_path):
     dmp = dumper("folder/file")
     dmp.commit(tmp_path)
     dmp.mkdir()
@@ -28,7 +22,7 @@ def test_mkdir(dumper, reset_environ, tmp_path):
 
 
 @mark.parametrize("dumper", (CfgIni, Toml, TextFile))
-def test_path_exists(dumper, reset_environ, tmp_path):
+def test_path_exists(dumper, tmp_path):
     (tmp_path / "file").touch()
     dmp = dumper("file")
     with raises(FileExistsError):
@@ -38,7 +32,7 @@ def test_path_exists(dumper, reset_environ, tmp_path):
 @mark.parametrize(
     "dumper, data, res",
     [
-        (
+        param(
             CfgIni,
             {
                 "section": {
@@ -54,8 +48,9 @@ def test_path_exists(dumper, reset_environ, tmp_path):
                 "third = \n\tone\n\ttwo\n"
                 "\n"
             ),
+            id="CfgIni",
         ),
-        (
+        param(
             Toml,
             {
                 "section": {
@@ -85,15 +80,17 @@ def test_path_exists(dumper, reset_environ, tmp_path):
                 "[section.fourth.one]\n"
                 'two = "2"\n'
             ),
+            id="Toml",
         ),
-        (
+        param(
             TextFile,
             ["first", "second", "third"],
             "first\nsecond\nthird\n",
+            id="TextFile",
         ),
     ],
 )
-def test_dumpfile(dumper, data, res, reset_environ, tmp_path):
+def test_dumpfile(dumper, data, res, tmp_path):
     dmp = dumper("file")
     dmp.commit(tmp_path)
     dmp.dump_in(data)
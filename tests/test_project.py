@@ -2,16 +2,30 @@ import os
 import sys
 from datetime import date
 
-from pytest import fixture, mark, raises
+from pytest import fixture, mark, param, raises
 
 from incipyt import commands, project
 from incipyt.__main__ import feed_environ
 from incipyt._internal.dumpers import TextFile, Toml
 from incipyt._internal.templates import StringTemplate
 from incipyt.project.meta_variables import Variable
+from incipyt.project.structure import _Structure
 from tests.utils import mock_stdin
 
 YEAR = date.today().year
+STRUCTURE_ENVIRON = {
+    "FOLDER_A": "folderA",
+    "FOLDER_B": "folderB",
+    "NAME_A": "testA",
+    "NAME_B": "testB",
+    "VALUE": "1",
+    "CONTENT": "text",
+}
+
+
+@fixture
+def fake_cmd(fake_process):
+    fake_process.register_subprocess(["cmd", "arg"], stdout=["lineA", "lineB"])
 
 
 class TestEnviron:
@@ -28,71 +42,60 @@ class TestEnviron:
             yield
 
         finally:
+            project.variables.clear()
             project.variables.update(variables)
 
-    @fixture
-    def empty_environ(self, fake_process, patch_variables):
-        fake_process.register_subprocess(["cmd", "arg"], stdout=["lineA", "lineB"])
-
-    @fixture
-    def simple_environ(self, fake_process, patch_variables):
-        fake_process.register_subprocess(["cmd", "arg"], stdout=["lineA", "lineB"])
-        project.environ["ONE"] = "1"
-
-    @mark.parametrize("env, input_values", (("empty_environ", ["1"]), ("simple_environ", [""])))
-    def test_pull(self, env, input_values, monkeypatch, request):
-        request.getfixturevalue(env)
+    @fixture(params=("empty", "simple"))
+    def environ(self, request, patch_variables):
+        if request.param == "simple":
+            project.environ["ONE"] = "1"
+
+    @mark.parametrize(
+        "environ, input_values",
+        (param("empty", ["1"], id="empty"), param("simple", [""], id="simple")),
+        indirect=["environ"],
+    )
+    def test_pull(self, environ, input_values, monkeypatch):
         mock_stdin(monkeypatch, input_values)
         assert project.environ["ONE"] == "1"
 
-    @mark.parametrize("env", ("simple_environ",))
-    def test_push(self, env, request):
-        request.getfixturevalue(env)
+    @mark.parametrize("environ", (param("simple", id="simple"),), indirect=True)
+    def test_push(self, environ):
         with raises(ValueError):
             project.environ["ONE"] = "11"
 
-    @mark.parametrize("env, input_values", (("simple_environ", [""]),))
-    def test_del_and_push(self, env, input_values, monkeypatch, request):
-        request.getfixturevalue(env)
+    @mark.parametrize(
+        "environ, input_values", (param("simple", [""], id="simple"),), indirect=["environ"]
+    )
+    def test_del_and_push(self, environ, input_values, monkeypatch):
         del project.environ["ONE"]
         project.environ["ONE"] = "11"
         mock_stdin(monkeypatch, input_values)
         assert project.environ["ONE"] == "11"
 
-    @mark.parametrize("env", ("empty_environ", "simple_environ"))
-    def test_python_cmd(self, env, request):
-        request.getfixturevalue(env)
+    def test_python_cmd(self, environ):
         assert project.environ["PYTHON_CMD"] == sys.executable
 
-    @mark.parametrize("env", ("empty_environ",))
-    def test_iter(self, env, request):
-        request.getfixturevalue(env)
+    @mark.parametrize("environ", (param("empty", id="empty"),), indirect=True)
+    def test_iter(self, environ):
         project.environ["TWO"] = "2"
         result = {key: project.environ[key] for key in project.environ}
         assert result == {"TWO": "2"}
 
-    @mark.parametrize("env", ("empty_environ", "simple_environ"))
-    def test_run(self, env, request):
-        request.getfixturevalue(env)
+    def test_run(self, fake_cmd):
         result = commands.run(["cmd", "arg"])
         assert result.stdout.decode() == f"lineA{os.linesep}lineB{os.linesep}"
 
 
 class TestStructure:
     @fixture
-    def reset_environ(self, fake_process):
-        fake_process.register_subprocess(["cmd", "arg"], stdout=["lineA", "lineB"])
+    def reset_environ(self):
         feed_environ()
-        project.environ["FOLDER_A"] = "folderA"
-        project.environ["FOLDER_B"] = "folderB"
-        project.environ["NAME_A"] = "testA"
-        project.environ["NAME_B"] = "testB"
-        project.environ["VALUE"] = "1"
-        project.environ["CONTENT"] = "text"
+        project.environ.update(STRUCTURE_ENVIRON)
 
     @fixture
-    def reset_structure(self):
-        project.structure.clear()
+    def reset_structure(self, monkeypatch):
+        monkeypatch.setattr(project, "structure", _Structure())
         project.structure.get_config_dict(Toml("{FOLDER_A}/{NAME_A}.toml"))["section"] = {
             "first": "{VALUE}"
         }
@@ -100,20 +103,24 @@ class TestStructure:
             "{CONTENT}"
         )
 
-    def test_get_new_configuration(self, reset_structure):
+    @mark.usefixtures("reset_structure")
+    def test_get_new_configuration(self):
         configuration = project.structure.get_config_dict(Toml("testC.toml"))
         assert configuration == {}
 
-    def test_get_old_configuration(self, reset_structure):
+    @mark.usefixtures("reset_structure")
+    def test_get_old_configuration(self):
         configuration = project.structure.get_config_dict(Toml("{FOLDER_A}/{NAME_A}.toml"))
         assert configuration == {"section": {"first": StringTemplate("{VALUE}")}}
 
-    def test_mkdir(self, reset_structure, reset_environ, tmp_path):
+    @mark.usefixtures("reset_structure", "reset_environ")
+    def test_mkdir(self, tmp_path):
         project.structure.mkdir(tmp_path)
         assert (tmp_path / "folderA").is_dir()
         assert (tmp_path / "folderB").is_dir()
 
-    def test_commit(self, reset_structure, reset_environ, tmp_path):
+    @mark.usefixtures("reset_structure", "reset_environ")
+    def test_commit(self, tmp_path):
         project.structure.mkdir(tmp_path)
         project.structure.commit()
         assert (tmp_path / "folderA" / "testA.toml").read_text() == '[section]\nfirst = "1"\n'
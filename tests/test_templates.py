@@ -1,67 +1,65 @@
-from collections import abc
+import copy
 
 import click
-from pytest import fixture, mark, raises
+from pytest import fixture, mark, param, raises
 
 from incipyt import project
-from incipyt.__main__ import feed_environ
 from incipyt._internal.templates import (
     ChoiceTemplate,
     StringTemplate,
     TemplateDict,
 )
-from incipyt.project.meta_variables import Variable
 from incipyt.project.structure import visit as structure_visit
 from tests.utils import mock_stdin
 
-
-@fixture(scope="function")
-def patch_variables():
-    try:
-        variables = project.variables.copy()
-        project.variables.clear()
-
-        def patch(env_vars=None, required=False):
-            env_vars = env_vars or []
-            if isinstance(env_vars, abc.Mapping):
-                for key, value in env_vars.items():
-                    Variable(key, default=value, required=required)
-            else:
-                for key in env_vars:
-                    Variable(key, required=required)
-            feed_environ()
-
-        yield patch
-
-    finally:
-        project.variables.update(variables)
+STRING_TEMPLATES = {
+    "simple_st": StringTemplate("{ONE}"),
+    "sanitizer_st": StringTemplate("{ONE}", sanitizer=lambda k, v: f"{v}-sanitizer"),
+    "multiple_st": StringTemplate("{ONE}-{TWO}-{THREE}"),
+}
+CHOICE_TEMPLATES = {
+    "simple_mst": ChoiceTemplate("a", "b"),
+    "formattable_mst": ChoiceTemplate(StringTemplate("a"), StringTemplate("b")),
+}
+COLLECTIONS = {
+    "empty": {},
+    "simple": {"1": StringTemplate("a")},
+    "nested": {"1": {"2": {"3": StringTemplate("a")}}},
+    "choice": {"1": ChoiceTemplate("a", "b")},
+    "sequence": {"1": [StringTemplate("a"), StringTemplate("b")]},
+}
+VISITED_TEMPLATES = {
+    "empty": {},
+    "simple": {"1": StringTemplate("{ONE}")},
+    "nested": {"1": {"2": {"3": StringTemplate("{ONE}")}}},
+    "choice": {"1": ChoiceTemplate("{ONE}", "b")},
+    "sequence": {"1": [StringTemplate("{ONE}"), {2: StringTemplate("b")}]},
+    "single": {"1": [StringTemplate("{ONE}")]},
+}
+SETITEM_CASES = (
+    param("empty", TemplateDict({"1": StringTemplate("x")}), id="empty"),
+    param("simple", TemplateDict({"1": ChoiceTemplate("x", "a")}), id="simple"),
+    param("choice", TemplateDict({"1": ChoiceTemplate.from_items("x", "a", "b")}), id="choice"),
+)
+CHAINED_SETITEM_CASES = (
+    param("empty", TemplateDict({"1": {"2": {"3": StringTemplate("x")}}}), id="empty"),
+    param("nested", TemplateDict({"1": {"2": {"3": ChoiceTemplate("x", "a")}}}), id="nested"),
+)
 
 
 class TestStringTemplate:
-    @fixture
-    def simple_st(self):
-        yield StringTemplate("{ONE}")
-
-    @fixture
-    def sanitizer_st(self):
-        yield StringTemplate("{ONE}", sanitizer=lambda k, v: f"{v}-sanitizer")
-
-    @fixture
-    def multiple_st(self):
-        yield StringTemplate("{ONE}-{TWO}-{THREE}")
-
     @mark.parametrize(
         "st, env_vars, stdin, res",
         (
-            ("simple_st", {"ONE": "1"}, "", "1"),
-            ("sanitizer_st", {"ONE": "1"}, "", "1"),
-            ("multiple_st", {"ONE": "1", "TWO": "2", "THREE": "3"}, "\n\n", "1"),
+            param("simple_st", {"ONE": "1"}, "", "1", id="simple"),
+            param("sanitizer_st", {"ONE": "1"}, "", "1", id="sanitizer"),
+            param(
+                "multiple_st", {"ONE": "1", "TWO": "2", "THREE": "3"}, "\n\n", "1", id="multiple"
+            ),
         ),
     )
-    def test_env_key_push_default(
-        self, st, env_vars, stdin, res, request, monkeypatch, patch_variables
-    ):
-        st = request.getfixturevalue(st)
+    def test_env_key_push_default(self, st, env_vars, stdin, res, monkeypatch, patch_variables):
+        st = STRING_TEMPLATES[st]
         mock_stdin(monkeypatch, stdin)
         patch_variables(env_vars)
         st.format()
@@ -70,13 +68,13 @@ class TestStringTemplate:
     @mark.parametrize(
         "st, env_vars, res",
         (
-            ("simple_st", {"ONE": "1"}, "1"),
-            ("sanitizer_st", {"ONE": "1"}, "1"),
-            ("multiple_st", {"ONE": "1", "TWO": "2", "THREE": "3"}, "1"),
+            param("simple_st", {"ONE": "1"}, "1", id="simple"),
+            param("sanitizer_st", {"ONE": "1"}, "1", id="sanitizer"),
+            param("multiple_st", {"ONE": "1", "TWO": "2", "THREE": "3"}, "1", id="multiple"),
         ),
     )
-    def test_env_key_push_environ(self, st, env_vars, res, request, patch_variables):
-        st = request.getfixturevalue(st)
+    def test_env_key_push_environ(self, st, env_vars, res, patch_variables):
+        st = STRING_TEMPLATES[st]
         patch_variables()
         project.environ.update(env_vars)
         st.format()
@@ -85,15 +83,13 @@ class TestStringTemplate:
     @mark.parametrize(
         "st, env_vars, stdin, res",
         (
-            ("simple_st", ["ONE"], "\n1", "1"),
-            ("sanitizer_st", ["ONE"], "\n1", "1"),
-            ("multiple_st", ["ONE", "TWO", "THREE"], "\n1\n2\n3", "1"),
+            param("simple_st", ["ONE"], "\n1", "1", id="simple"),
+            param("sanitizer_st", ["ONE"], "\n1", "1", id="sanitizer"),
+            param("multiple_st", ["ONE", "TWO", "THREE"], "\n1\n2\n3", "1", id="multiple"),
         ),
     )
-    def test_env_key_push_required(
-        self, st, env_vars, stdin, res, request, monkeypatch, patch_variables
-    ):
-        st = request.getfixturevalue(st)
+    def test_env_key_push_required(self, st, env_vars, stdin, res, monkeypatch, patch_variables):
+        st = STRING_TEMPLATES[st]
         mock_stdin(monkeypatch, stdin)
         patch_variables(env_vars, required=True)
         st.format()
@@ -102,15 +98,19 @@ class TestStringTemplate:
     @mark.parametrize(
         "st, env_vars, stdin, res",
         (
-            ("simple_st", {"ONE": "1"}, "", "1"),
-            ("sanitizer_st", {"ONE": "1"}, "", "1-sanitizer"),
-            ("multiple_st", {"ONE": "1", "TWO": "2", "THREE": "3"}, "\n\n", "1-2-3"),
+            param("simple_st", {"ONE": "1"}, "", "1", id="simple"),
+            param("sanitizer_st", {"ONE": "1"}, "", "1-sanitizer", id="sanitizer"),
+            param(
+                "multiple_st",
+                {"ONE": "1", "TWO": "2", "THREE": "3"},
+                "\n\n",
+                "1-2-3",
+                id="multiple",
+            ),
         ),
     )
-    def test_format_default(
-        self, st, env_vars, stdin, res, request, monkeypatch, patch_variables
-    ):
-        st = request.getfixturevalue(st)
+    def test_format_default(self, st, env_vars, stdin, res, monkeypatch, patch_variables):
+        st = STRING_TEMPLATES[st]
         mock_stdin(monkeypatch, stdin)
         patch_variables(env_vars)
         assert st.format() == res
@@ -118,13 +118,13 @@ class TestStringTemplate:
     @mark.parametrize(
         "st, env_vars, res",
         (
-            ("simple_st", {"ONE": "1"}, "1"),
-            ("sanitizer_st", {"ONE": "1"}, "1-sanitizer"),
-            ("multiple_st", {"ONE": "1", "TWO": "2", "THREE": "3"}, "1-2-3"),
+            param("simple_st", {"ONE": "1"}, "1", id="simple"),
+            param("sanitizer_st", {"ONE": "1"}, "1-sanitizer", id="sanitizer"),
+            param("multiple_st", {"ONE": "1", "TWO": "2", "THREE": "3"}, "1-2-3", id="multiple"),
         ),
     )
-    def test_format_environ(self, st, env_vars, res, request, patch_variables):
-        st = request.getfixturevalue(st)
+    def test_format_environ(self, st, env_vars, res, patch_variables):
+        st = STRING_TEMPLATES[st]
         patch_variables()
         project.environ.update(env_vars)
         assert st.format() == res
@@ -132,13 +132,13 @@ class TestStringTemplate:
     @mark.parametrize(
         "st, env_vars, stdin",
         (
-            ("simple_st", {}, ""),
-            ("sanitizer_st", {}, ""),
-            ("multiple_st", {"TWO": "2", "THREE": "3"}, "\n\n"),
+            param("simple_st", {}, "", id="simple"),
+            param("sanitizer_st", {}, "", id="sanitizer"),
+            param("multiple_st", {"TWO": "2", "THREE": "3"}, "\n\n", id="multiple"),
         ),
     )
-    def test_format_none(self, st, env_vars, stdin, request, monkeypatch, patch_variables):
-        st = request.getfixturevalue(st)
+    def test_format_none(self, st, env_vars, stdin, monkeypatch, patch_variables):
+        st = STRING_TEMPLATES[st]
         mock_stdin(monkeypatch, stdin)
         patch_variables(env_vars)
         with raises(ValueError):
@@ -147,29 +147,25 @@ class TestStringTemplate:
     @mark.parametrize(
         "st, env_vars, stdin, res",
         (
-            ("simple_st", ["ONE"], "\n1", "1"),
-            ("sanitizer_st", ["ONE"], "\n1", "1-sanitizer"),
-            ("multiple_st", ["ONE", "TWO", "THREE"], "\n1\n2\n3", "1-2-3"),
+            param("simple_st", ["ONE"], "\n1", "1", id="simple"),
+            param("sanitizer_st", ["ONE"], "\n1", "1-sanitizer", id="sanitizer"),
+            param("multiple_st", ["ONE", "TWO", "THREE"], "\n1\n2\n3", "1-2-3", id="multiple"),
         ),
     )
-    def test_format_required(
-        self, st, env_vars, stdin, res, request, monkeypatch, patch_variables
-    ):
-        st = request.getfixturevalue(st)
+    def test_format_required(self, st, env_vars, stdin, res, monkeypatch, patch_variables):
+        st = STRING_TEMPLATES[st]
         mock_stdin(monkeypatch, stdin)
         patch_variables(env_vars, required=True)
         assert st.format() == res
 
 
 class TestChoiceTemplate:
-    @fixture
-    def simple_mst(self, patch_variables):
-        patch_variables()
+    @fixture(scope="class")
+    def simple_mst(self):
         yield ChoiceTemplate("a", "b")
 
-    @fixture
-    def formattable_mst(self, patch_variables):
-        patch_variables()
+    @fixture(scope="class")
+    def formattable_mst(self):
         yield ChoiceTemplate(StringTemplate("a"), StringTemplate("b"))
 
     def test_mst_tail(self, simple_mst):
@@ -183,8 +179,8 @@ class TestChoiceTemplate:
         yield mst.format() == "a"
 
     @mark.parametrize("mst", ("simple_mst", "formattable_mst"))
-    def test_call_invalid(self, mst, monkeypatch, request):
-        mst = request.getfixturevalue(mst)
+    def test_call_invalid(self, mst, monkeypatch):
+        mst = CHOICE_TEMPLATES[mst]
         mock_stdin(monkeypatch, "x")
         with raises(click.exceptions.Abort):
             mst.format()
@@ -192,90 +188,48 @@ class TestChoiceTemplate:
 
 class TestTemplateCollection:
     @fixture
-    def empty_td(self, patch_variables):
+    def td(self, request, patch_variables):
         patch_variables()
-        yield TemplateDict({})
+        return TemplateDict(copy.deepcopy(COLLECTIONS[request.param]))
 
-    @fixture
-    def simple_td(self, patch_variables):
-        patch_variables()
-        yield TemplateDict({"1": StringTemplate("a")})
-
-    @fixture
-    def nested_td(self, patch_variables):
-        patch_variables()
-        yield TemplateDict({"1": {"2": {"3": StringTemplate("a")}}})
-
-    @fixture
-    def choice_td(self, patch_variables):
-        patch_variables()
-        yield TemplateDict({"1": ChoiceTemplate("a", "b")})
-
-    @fixture
-    def sequence_td(self, patch_variables):
-        patch_variables()
-        yield TemplateDict({"1": [StringTemplate("a"), StringTemplate("b")]})
-
-    @mark.parametrize(
-        "td, res",
-        (
-            ("empty_td", TemplateDict({"1": StringTemplate("x")})),
-            ("simple_td", TemplateDict({"1": ChoiceTemplate("x", "a")})),
-            ("choice_td", TemplateDict({"1": ChoiceTemplate.from_items("x", "a", "b")})),
-        ),
-    )
-    def test_setitem(self, td, res, request, patch_variables):
-        td = request.getfixturevalue(td)
-        td["1"] = "x"
+    @mark.parametrize("value", (param("x", id="str"), param(StringTemplate("x"), id="template")))
+    @mark.parametrize("td, res", SETITEM_CASES, indirect=["td"])
+    def test_setitem(self, td, res, value):
+        td["1"] = value
         assert td == res
 
-    @mark.parametrize(
-        "td, res",
-        (
-            ("empty_td", TemplateDict({"1": StringTemplate("x")})),
-            ("simple_td", TemplateDict({"1": ChoiceTemplate("x", "a")})),
-            ("choice_td", TemplateDict({"1": ChoiceTemplate.from_items("x", "a", "b")})),
-        ),
-    )
-    def test_setitem_callable(self, td, res, request, patch_variables):
-        td = request.getfixturevalue(td)
-        td["1"] = StringTemplate("x")
-        assert td == res
-
-    @mark.parametrize(
-        "td, res",
-        (
-            ("empty_td", TemplateDict({"1": {"2": {"3": StringTemplate("x")}}})),
-            ("nested_td", TemplateDict({"1": {"2": {"3": ChoiceTemplate("x", "a")}}})),
-        ),
-    )
-    def test_chained_setitem(self, td, res, request, patch_variables):
-        td = request.getfixturevalue(td)
+    @mark.parametrize("td, res", CHAINED_SETITEM_CASES, indirect=["td"])
+    def test_chained_setitem(self, td, res):
         td["1", "2", "3"] = "x"
         assert td == res
 
     @mark.parametrize(
         "td, res",
         (
-            ("empty_td", TemplateDict({"1": [StringTemplate("a"), StringTemplate("x")]})),
-            (
-                "sequence_td",
+            param(
+                "empty",
+                TemplateDict({"1": [StringTemplate("a"), StringTemplate("x")]}),
+                id="empty",
+            ),
+            param(
+                "sequence",
                 TemplateDict(
                     {"1": [StringTemplate("a"), StringTemplate("b"), StringTemplate("x")]}
                 ),
+                id="sequence",
             ),
         ),
+        indirect=["td"],
     )
-    def test_sequence_setitem(self, td, res, request, patch_variables):
-        td = request.getfixturevalue(td)
+    def test_sequence_setitem(self, td, res):
         td["1"] = ["a", "x"]
         assert td == res
 
     @mark.parametrize(
         "td, res",
         (
-            (
-                "empty_td",
+            param(
+                "empty",
                 TemplateDict(
                     {
                         "1": [
@@ -285,9 +239,10 @@ class TestTemplateCollection:
                         ]
                     }
                 ),
+                id="empty",
             ),
-            (
-                "sequence_td",
+            param(
+                "sequence",
                 TemplateDict(
                     {
                         "1": [
@@ -298,75 +253,44 @@ class TestTemplateCollection:
                         ]
                     }
                 ),
+                id="sequence",
             ),
         ),
+        indirect=["td"],
     )
-    def test_nested_sequence_setitem(self, td, res, request):
-        td = request.getfixturevalue(td)
+    def test_nested_sequence_setitem(self, td, res):
         td["1"] = ["a", ["x", "y"], {"2": "z"}]
         assert td == res
 
-    @mark.parametrize(
-        "td, res",
-        (
-            ("empty_td", TemplateDict({"1": {"2": {"3": StringTemplate("x")}}})),
-            ("nested_td", TemplateDict({"1": {"2": {"3": ChoiceTemplate("x", "a")}}})),
-        ),
-    )
-    def test_ior(self, td, res, request):
-        td = request.getfixturevalue(td)
+    @mark.parametrize("td, res", CHAINED_SETITEM_CASES, indirect=["td"])
+    def test_ior(self, td, res):
         td.update({"1": {"2": {"3": "x"}}})
         assert td == res
 
 
 class TestTemplateVisitor:
     @fixture
-    def empty_td(self, patch_variables):
-        patch_variables()
-        yield {}
-
-    @fixture
-    def simple_td(self, patch_variables):
-        patch_variables(["ONE"])
-        yield {"1": StringTemplate("{ONE}")}
-
-    @fixture
-    def nested_td(self, patch_variables):
-        patch_variables(["ONE"])
-        yield {"1": {"2": {"3": StringTemplate("{ONE}")}}}
-
-    @fixture
-    def choice_td(self, patch_variables):
-        patch_variables(["ONE"])
-        yield {"1": ChoiceTemplate("{ONE}", "b")}
-
-    @fixture
-    def sequence_td(self, patch_variables):
-        patch_variables(["ONE"])
-        yield {"1": [StringTemplate("{ONE}"), {2: StringTemplate("b")}]}
-
-    @fixture
-    def single_td(self, patch_variables):
+    def td(self, request, patch_variables):
         patch_variables(["ONE"])
-        yield {"1": [StringTemplate("{ONE}")]}
+        return copy.deepcopy(VISITED_TEMPLATES[request.param])
 
     @mark.parametrize(
         "td, res, input_values",
         (
-            ("empty_td", {}, []),
-            ("simple_td", {"1": "a"}, ["a"]),
-            ("simple_td", {}, [""]),
-            ("nested_td", {"1": {"2": {"3": "a"}}}, ["a"]),
-            ("nested_td", {}, [""]),
-            ("sequence_td", {"1": ["a", {2: "b"}]}, ["a"]),
-            ("sequence_td", {"1": [{2: "b"}]}, [""]),
-            ("single_td", {"1": ["a"]}, ["a"]),
-            ("single_td", {}, [""]),
-            ("choice_td", {"1": "a"}, ["a", "a"]),
+            param("empty", {}, [], id="empty"),
+            param("simple", {"1": "a"}, ["a"], id="simple"),
+            param("simple", {}, [""], id="simple-blank"),
+            param("nested", {"1": {"2": {"3": "a"}}}, ["a"], id="nested"),
+            param("nested", {}, [""], id="nested-blank"),
+            param("sequence", {"1": ["a", {2: "b"}]}, ["a"], id="sequence"),
+            param("sequence", {"1": [{2: "b"}]}, [""], id="sequence-blank"),
+            param("single", {"1": ["a"]}, ["a"], id="single"),
+            param("single", {}, [""], id="single-blank"),
+            param("choice", {"1": "a"}, ["a", "a"], id="choice"),
         ),
+        indirect=["td"],
     )
-    def test_call(self, td, res, input_values, monkeypatch, request, patch_variables):
-        td = request.getfixturevalue(td)
+    def test_call(self, td, res, input_values, monkeypatch):
         mock_stdin(monkeypatch, input_values)
         structure_visit(td)
         assert td == res
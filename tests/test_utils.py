@@ -1,6 +1,6 @@
 from io import StringIO
 
-from pytest import mark
+from pytest import mark, param
 
 from incipyt._internal.utils import is_nonstring_sequence
 
@@ -8,13 +8,13 @@ from incipyt._internal.utils import is_nonstring_sequence
 @mark.parametrize(
     "obj, res",
     (
-        (None, False),
-        (b"abc", False),
-        ("abc", False),
-        (StringIO("abc"), False),
-        ({}, False),
-        ([], True),
-        ((), True),
+        param(None, False, id="none"),
+        param(b"abc", False, id="bytes"),
+        param("abc", False, id="str"),
+        param(StringIO("abc"), False, id="stream"),
+        param({}, False, id="dict"),
+        param([], True, id="list"),
+        param((), True, id="tuple"),
     ),
 )
 def test_nonstring_sequence(obj, res):
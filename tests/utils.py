@@ -6,4 +6,5 @@ from incipyt._internal.utils import is_nonstring_sequence
 def mock_stdin(monkeypatch, inputs):
     if not is_nonstring_sequence(inputs):
         inputs = (inputs,)
-    monkeypatch.setattr("sys.stdin", io.StringIO("".join(f"{v}\n" for v in inputs)))
+    text = "\n".join(map(str, inputs)) + "\n" if inputs else ""
+    monkeypatch.setattr("sys.stdin", io.StringIO(text))